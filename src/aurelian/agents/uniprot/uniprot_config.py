@@ -17,6 +17,8 @@ class UniprotConfig(HasWorkdir):
     # Options for the bioservices UniProt client
     uniprot_client_options: Dict[str, Any] = field(default_factory=dict)
 
+    _uniprot_client: Optional[UniProt] = None
+
     def __post_init__(self):
         """Initialize the config with default values."""
         # HasWorkdir doesn't have a __post_init__ method, so we don't call super()
@@ -28,8 +30,14 @@ class UniprotConfig(HasWorkdir):
             self.workdir = WorkDir()
 
     def get_uniprot_client(self) -> UniProt:
-        """Get a configured UniProt client."""
-        return UniProt(**self.uniprot_client_options)
+        """Get a configured UniProt client.
+
+        The client is created on first use and then reused, so all tool calls share
+        its HTTP session and pooled connections.
+        """
+        if self._uniprot_client is None:
+            self._uniprot_client = UniProt(**self.uniprot_client_options)
+        return self._uniprot_client
 
 
 def get_config() -> UniprotConfig:
@@ -22,6 +22,18 @@ def normalize_uniprot_id(uniprot_id: str) -> str:
     return uniprot_id
 
 
+def normalize_uniprot_ids(uniprot_ids: List[str]) -> List[str]:
+    """Normalize a list of Uniprot IDs, as :func:`normalize_uniprot_id` does for a single ID.
+
+    Args:
+        uniprot_ids: The Uniprot IDs
+
+    Returns:
+        The normalized Uniprot IDs, in the same order
+    """
+    return [uniprot_id.rpartition(":")[2] for uniprot_id in uniprot_ids]
+
+
 def search(ctx: RunContext[UniprotConfig], query: str) -> str:
     """Search UniProt with a query string.
 
@@ -86,14 +98,15 @@ def uniprot_mapping(
     Returns:
         A dictionary mapping UniProt accessions to entries in the target database
     """
+    if not uniprot_accs:
+        raise ModelRetry("No UniProt accessions provided for mapping")
+
     config = ctx.deps or get_config()
     u = config.get_uniprot_client()
     
     try:
-        if not uniprot_accs:
-            raise ModelRetry("No UniProt accessions provided for mapping")
-            
-        normalized_accs = [normalize_uniprot_id(x) for x in uniprot_accs]
+        # one mapping job per call; duplicate accessions would only enlarge it
+        normalized_accs = list(dict.fromkeys(normalize_uniprot_ids(uniprot_accs)))
         result = u.mapping("UniProtKB_AC-ID", target_database, ",".join(normalized_accs))
         
         if not result:
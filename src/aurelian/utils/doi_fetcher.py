@@ -1,15 +1,64 @@
+import json
 import os
 import re
+import threading
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import logfire
 import requests
 import requests_cache
-from bs4 import BeautifulSoup
+from lxml import etree
 from markitdown import MarkItDown
 from openai import BaseModel
 from pydantic import Field
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Pattern recommended by Crossref, extended with the bracket characters seen in older Wiley DOIs
+DOI_REGEX = re.compile(r"^10\.\d{4,9}/[-._;()/:<>\[\]A-Z0-9]+$", re.IGNORECASE)
+DOI_PREFIX_REGEX = re.compile(r"^(?:doi:\s*|(?:https?://)?(?:dx\.|www\.)?doi\.org/)", re.IGNORECASE)
+
+# Crossref fields used when fetching metadata for full text lookups; requesting only these
+# shrinks the record from tens of KB (references, funders, licenses) to a few KB
+CROSSREF_FIELDS = frozenset(
+    ["DOI", "title", "abstract", "author", "type", "publisher", "issued", "container-title", "ISSN"]
+)
+
+# (connect, read) timeouts in seconds; full-text mirrors are often slow, so fail fast on them
+REQUEST_TIMEOUT = (3.05, 15)
+MIRROR_REQUEST_TIMEOUT = (3.05, 8)
+
+# Longest wait, in seconds, honored from a server's Retry-After header
+MAX_RETRY_AFTER = 30
+
+
+class _CappedRetry(Retry):
+    """Retry that honors Retry-After, but never waits longer than ``MAX_RETRY_AFTER``."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+# Transient failures (rate limiting, gateway errors) on the Crossref and Unpaywall APIs are
+# retried with exponential backoff, honoring any (capped) Retry-After header sent by the server
+RETRY_STRATEGY = _CappedRetry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+)
 
 
 class FullTextInfo(BaseModel):
@@ -23,9 +72,95 @@ class FullTextInfo(BaseModel):
     pdf_url: Optional[str] = Field(None, description="URL to the PDF version of the article")
 
 
+def normalize_doi(doi: str) -> Optional[str]:
+    """Normalize a DOI, stripping any ``doi:`` or resolver URL prefix.
+
+    Example:
+        >>> normalize_doi(" doi:10.1038/nature12373 ")
+        '10.1038/nature12373'
+        >>> normalize_doi("https://doi.org/10.1128/msystems.00045-18")
+        '10.1128/msystems.00045-18'
+        >>> normalize_doi("https://www.doi.org/10.1038/nature12373")
+        '10.1038/nature12373'
+        >>> normalize_doi("doi.org/10.1038/nature12373")
+        '10.1038/nature12373'
+        >>> normalize_doi("doi:10.xxxx") is None
+        True
+
+    Args:
+        doi: A DOI, possibly prefixed or padded with whitespace
+
+    Returns:
+        Optional[str]: The bare DOI, or None if it is not a syntactically valid DOI
+
+    """
+    doi = DOI_PREFIX_REGEX.sub("", doi.strip()).strip()
+    if not DOI_REGEX.match(doi):
+        return None
+    return doi
+
+
+def _find_embedded_pdf_src(chunks: Iterable[bytes]) -> Optional[str]:
+    """Find the ``src`` of the ``<embed id="pdf">`` (or ``<iframe id="pdf">``) element in a streamed HTML page.
+
+    The page is fed incrementally to a pull parser, so parsing stops (and no more
+    of the body is read) as soon as the element is found.
+
+    Example:
+        >>> _find_embedded_pdf_src([b'<html><body><embed id="pdf" ', b'src="//x.org/a.pdf"></body></html>'])
+        '//x.org/a.pdf'
+        >>> _find_embedded_pdf_src([b'<html><body><p>nothing here</p></body></html>']) is None
+        True
+
+    Args:
+        chunks: Iterable of raw HTML byte chunks
+
+    Returns:
+        Optional[str]: The src attribute if found, None otherwise
+
+    """
+    parser = etree.HTMLPullParser(events=("start",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if element.tag in ("embed", "iframe") and element.get("id") == "pdf" and element.get("src"):
+                return element.get("src")
+    return None
+
+
+def _oa_priority(location: Dict[str, Any]) -> int:
+    """Rank an Unpaywall OA location; lower is better.
+
+    Example:
+        >>> _oa_priority({"host_type": "publisher", "version": "publishedVersion"})
+        0
+        >>> _oa_priority({"host_type": "publisher", "version": "acceptedVersion"})
+        1
+        >>> _oa_priority({"host_type": "repository", "version": "publishedVersion"})
+        2
+        >>> _oa_priority({"host_type": "repository", "version": "submittedVersion"})
+        3
+
+    Args:
+        location: An entry from Unpaywall ``oa_locations``
+
+    Returns:
+        int: 0 publisher/published, 1 publisher/any, 2 other/published, 3 other
+
+    """
+    is_publisher = location.get("host_type") == "publisher"
+    is_published = location.get("version") == "publishedVersion"
+    if is_publisher:
+        return 0 if is_published else 1
+    return 2 if is_published else 3
+
+
 class DOIFetcher:
     """Fetch metadata and full text for a DOI using various APIs."""
 
+    _default: Optional["DOIFetcher"] = None
+    _default_lock = threading.Lock()
+
     def __init__(self, email: Optional[str] = None, url_prefixes: Optional[List[str]] = None):
         """Initialize the DOI fetcher with a contact email (required by some APIs).
 
@@ -37,6 +172,43 @@ class DOIFetcher:
         self.email = email or os.getenv("EMAIL") or "test@example.com"
         self.url_prefixes = url_prefixes or os.getenv("DOI_FULL_TEXT_URLS", "").split(",")
         self.headers = {"User-Agent": f"DOIFetcher/1.0 (mailto:{email})", "Accept": "application/json"}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=RETRY_STRATEGY, pool_maxsize=20)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # full-text mirrors are probed one after another, so a failing mirror is skipped, not retried
+        self.mirror_session = requests.Session()
+
+    @classmethod
+    def default(cls) -> "DOIFetcher":
+        """Get the process-wide shared fetcher, creating it on first use.
+
+        Sharing one fetcher (and so one session) keeps connections to Crossref and
+        Unpaywall alive across all tools that look up DOIs.
+
+        Example:
+            >>> DOIFetcher.default() is DOIFetcher.default()
+            True
+
+        Returns:
+            DOIFetcher: The shared fetcher
+
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def close(self) -> None:
+        """Close the underlying HTTP sessions."""
+        self.session.close()
+        self.mirror_session.close()
+
+    def __enter__(self) -> "DOIFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def clean_text(self, text: str) -> str:
         """Clean extracted text by removing extra whitespace and normalized characters.
@@ -54,23 +226,46 @@ class DOIFetcher:
         text = "".join(char for char in text if char.isprintable())
         return text.strip()
 
-    def get_metadata(self, doi: str, strict=False) -> Optional[Dict[str, Any]]:
+    def get_metadata(self, doi: str, strict=False, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """Fetch metadata for a DOI using the Crossref API.
 
+        Example:
+            >>> fetcher = DOIFetcher()
+            >>> metadata = fetcher.get_metadata("10.1128/msystems.00045-18", fields=CROSSREF_FIELDS)
+            >>> metadata["type"]
+            'journal-article'
+            >>> "reference" in metadata
+            False
+
         Args:
             doi (str): The DOI to look up
             strict (bool): Raise exceptions if API call fails
+            fields (Iterable[str]): Restrict the record to these top-level fields (default: full record)
 
         Returns:
             Optional[Dict[str, Any]]: Metadata dictionary if successful, None otherwise
 
         """
-        base_url = "https://api.crossref.org/works/"
+        normalized_doi = normalize_doi(doi)
+        if not normalized_doi:
+            if strict:
+                raise ValueError(f"Invalid DOI: {doi}")
+            logfire.warn(f"Invalid DOI: {doi}")
+            return None
+        doi = normalized_doi
+        base_url = "https://api.crossref.org/works"
         try:
-            response = requests.get(f"{base_url}{doi}", headers=self.headers)
+            if fields:
+                # select is only honored on the works list route, so look the DOI up with a filter
+                params = {"filter": f"doi:{doi}", "select": ",".join(sorted(fields)), "rows": 1}
+                response = self.session.get(base_url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                items = json_loads(response.content)["message"]["items"]
+                return items[0] if items else None
+            response = self.session.get(f"{base_url}/{doi}", headers=self.headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()["message"]
-        except Exception as e:
+            return json_loads(response.content)["message"]
+        except (requests.RequestException, ValueError) as e:
             if strict:
                 raise e
             logfire.warn(f"Error fetching metadata: {e}")
@@ -95,12 +290,19 @@ class DOIFetcher:
             Optional[Dict[str, Any]]: Unpaywall data if successful, None otherwise
 
         """
+        normalized_doi = normalize_doi(doi)
+        if not normalized_doi:
+            if strict:
+                raise ValueError(f"Invalid DOI: {doi}")
+            logfire.warn(f"Invalid DOI: {doi}")
+            return None
+        doi = normalized_doi
         base_url = f"https://api.unpaywall.org/v2/{doi}"
         try:
-            response = requests.get(f"{base_url}?email={self.email}")
+            response = self.session.get(f"{base_url}?email={self.email}", timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
+            return json_loads(response.content)
+        except (requests.RequestException, ValueError) as e:
             if strict:
                 raise e
             logfire.warn(f"Error fetching Unpaywall data: {e}")
@@ -164,22 +366,25 @@ class DOIFetcher:
             FullTextInfo: Full text information
 
         """
+        doi = normalize_doi(doi)
+        if not doi:
+            return None
+
         # Get metadata
-        metadata = self.get_metadata(doi)
+        metadata = self.get_metadata(doi, fields=CROSSREF_FIELDS)
 
         # Check Unpaywall
         unpaywall_data = self.get_unpaywall_info(doi)
         if unpaywall_data and unpaywall_data.get("is_oa"):
-            locations = unpaywall_data.get("oa_locations", [])
-            if unpaywall_data.get("best_oa_location"):
-                best_oa_location = unpaywall_data.get("best_oa_location")
-                locations = [best_oa_location] + locations
+            locations = unpaywall_data.get("oa_locations") or []
+            best_oa_location = unpaywall_data.get("best_oa_location")
+            if best_oa_location:
+                locations = [best_oa_location, *locations]
 
-            # Find best open access location
-            for location in locations:
-                pdf_url = location.get("url_for_pdf")
-                if pdf_url:
-                    return FullTextInfo(text=None, pdf_url=pdf_url, source="unpaywall", metadata=metadata)
+            # Find best open access location with a PDF; ties keep Unpaywall's ordering
+            location = min((loc for loc in locations if loc.get("url_for_pdf")), key=_oa_priority, default=None)
+            if location:
+                return FullTextInfo(text=None, pdf_url=location["url_for_pdf"], source="unpaywall", metadata=metadata)
 
         # Fallback
         url_prefixes = os.getenv("DOI_FULL_TEXT_URLS", "").split(",")
@@ -188,12 +393,11 @@ class DOIFetcher:
             url_prefix.rstrip("/")
             url = f"{url_prefix}/{doi}"
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    pdf_embed = soup.find("embed", id="pdf")
-                    if pdf_embed and pdf_embed.get("src"):
-                        pdf_url = pdf_embed["src"]
+                with self.mirror_session.get(url, stream=True, timeout=MIRROR_REQUEST_TIMEOUT) as response:
+                    if response.status_code != 200:
+                        continue
+                    pdf_url = _find_embedded_pdf_src(response.iter_content(chunk_size=8192))
+                    if pdf_url:
                         # Remove any URL parameters after #
                         pdf_url = pdf_url.split("#")[0]
                         if not pdf_url.startswith("http"):
@@ -203,7 +407,7 @@ class DOIFetcher:
                             source=url,
                             metadata=metadata,
                         )
-            except Exception:
+            except requests.RequestException:
                 continue
 
     def text_from_pdf_url(self, pdf_url: str, raise_for_status=False) -> Optional[str]:
@@ -224,7 +428,7 @@ class DOIFetcher:
         """
         session = requests_cache.CachedSession("pdf_cache")
         # Download the PDF
-        response = session.get(pdf_url)
+        response = session.get(pdf_url, timeout=REQUEST_TIMEOUT)
         if raise_for_status:
             response.raise_for_status()
         if response.status_code != 200:
@@ -12,7 +12,7 @@ EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=pubme
 
 DOI_PATTERN = r"/(10\.\d{4,9}/[\w\-.]+)"
 
-doi_fetcher = DOIFetcher()
+doi_fetcher = DOIFetcher.default()
 
 
 def extract_doi_from_url(url: str) -> Optional[str]:
@@ -1,11 +1,91 @@
+import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 import pytest
 
 
+# Run before pytest-xdist's own hook, which reads the ``xdist_group`` marks to build node ids
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Adjust collected tests.
+
+    * Skip tests marked ``live`` (real LLM or remote service calls) when running in GitHub Actions.
+    * Under pytest-xdist, group tests by module (unless a test sets its own ``xdist_group``) so that
+      ``--dist=loadgroup`` keeps each file, and its module/session-scoped fixtures, on one worker.
+    """
+    skip_live = pytest.mark.skip(reason="Skipping in GitHub Actions") if os.getenv("GITHUB_ACTIONS") == "true" else None
+    group_by_module = config.pluginmanager.hasplugin("xdist")
+    for item in items:
+        if skip_live and "live" in item.keywords:
+            item.add_marker(skip_live)
+        if group_by_module and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name=item.module.__name__))
+
+
+ENV_FILE = Path(__file__).parent.parent / ".env"
+
 
 @pytest.fixture(scope="session", autouse=True)
 def load_env():
     """Load environment variables from .env file for all tests."""
-    load_dotenv()
+    if ENV_FILE.is_file():
+        load_dotenv(dotenv_path=ENV_FILE, override=False)
+
+
+@pytest.fixture
+def record_agent_property(record_property, request):
+    """Record an agent or agent result as a test property, serializing it in full only for detailed runs.
+
+    ``str()`` of an agent walks its tool registry and prompts, and pytest keeps every recorded
+    property alive for the whole session. Full values are recorded for ``--report-log`` runs
+    (used to build the markdown reports) and at ``-vv``; otherwise only the type and length.
+    """
+    detailed = request.config.getoption("verbose") >= 2 or request.config.getoption("report_log", None)
+
+    def _record(name, value):
+        if detailed:
+            record_property(name, str(value))
+        elif hasattr(value, "__len__"):
+            record_property(name, f"{type(value).__name__} (length {len(value)})")
+        else:
+            record_property(name, type(value).__name__)
+
+    return _record
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Configure pytest-recording cassettes for tests marked with ``@pytest.mark.vcr``.
+
+    Cassettes missing on disk are recorded on first run and replayed afterwards;
+    credentials are scrubbed before anything is written.
+    """
+    return {
+        "record_mode": "once",
+        "filter_headers": ["authorization", "x-api-key", "openai-organization", "cookie"],
+        "filter_query_parameters": ["api_key", "email"],
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette_dir(request):
+    """Store cassettes under tests/cassettes/<test module>."""
+    return str(Path(__file__).parent / "cassettes" / request.module.__name__.split(".")[-1])
+
+
+@pytest.fixture(scope="session")
+def command_help():
+    """Render the --help text of an aurelian subcommand directly, without going through CliRunner."""
+    import click
+
+    from aurelian.cli import main
+
+    main_ctx = click.Context(main, info_name="aurelian")
+
+    def _command_help(name: str) -> str:
+        command = main.commands[name]
+        return command.get_help(click.Context(command, info_name=name, parent=main_ctx))
+
+    return _command_help
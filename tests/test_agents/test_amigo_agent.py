@@ -1,26 +1,30 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
-
-from aurelian.agents.amigo.amigo_config import AmiGODependencies
-from aurelian.agents.amigo.amigo_agent import amigo_agent
-from oaklib import get_adapter
+pytestmark = pytest.mark.live
 
 
+# This test now requires using the async function, so we'll skip it and move the logic to a test
+# that uses the agent directly
+@pytest.mark.skip(reason="This test needs to be updated for the new async API structure.")
 def test_pmid():
     """
     Test the PMID function
     """
-    # This test now requires using the async function, so we'll skip it and move the logic to a test
-    # that uses the agent directly
-    pytest.skip("This test needs to be updated for the new async API structure.")
 
 
 
-@pytest.fixture
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def amigo_agent():
+    from aurelian.agents.amigo.amigo_agent import amigo_agent
+
+    return amigo_agent
+
+
+@pytest.fixture(scope="module")
 def deps():
+    from aurelian.agents.amigo.amigo_config import AmiGODependencies
+
     return AmiGODependencies()
 
 @pytest.mark.parametrize(
@@ -29,12 +33,13 @@ def deps():
         ("Lookup in amigo annotations to PMID:19661248 - what genes?", "Nox1"),
     ]
 )
-def test_amigo_agent(record_property, deps, query, ideal):
-    record_property("agent", str(amigo_agent))
+@pytest.mark.vcr
+def test_amigo_agent(record_property, record_agent_property, amigo_agent, deps, query, ideal):
+    record_agent_property("agent", amigo_agent)
     record_property("query", query)
     r = amigo_agent.run_sync(query, deps=deps)
     data = r.data
-    record_property("result", str(data))
+    record_agent_property("result", data)
     assert data is not None
     if ideal is not None:
         assert ideal in data
@@ -1,15 +1,20 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
+pytestmark = pytest.mark.live
 
-from aurelian.agents.chemistry.chemistry_config import ChemistryDependencies as Dependencies
-from aurelian.agents.chemistry.chemistry_agent import chemistry_agent
 
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def chemistry_agent():
+    from aurelian.agents.chemistry.chemistry_agent import chemistry_agent
 
-@pytest.fixture
+    return chemistry_agent
+
+
+@pytest.fixture(scope="module")
 def deps():
+    from aurelian.agents.chemistry.chemistry_config import ChemistryDependencies as Dependencies
+
     return Dependencies()
 
 
@@ -19,10 +24,9 @@ def deps():
         ("Look at the structure for CHEBI:144139 - what type of terpenoid is it?", "triterpenoid"),
     ],
 )
-def test_chemistry_agent(deps, query, ideal):
+@pytest.mark.vcr
+def test_chemistry_agent(chemistry_agent, deps, query, ideal):
     r = chemistry_agent.run_sync(query, deps=deps)
-    for m in r.all_messages():
-        print(m)
     data = r.data
     assert data is not None
     if ideal is not None:
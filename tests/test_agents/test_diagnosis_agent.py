@@ -1,14 +1,20 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
+pytestmark = pytest.mark.live
 
-from aurelian.agents.diagnosis_agent import DiagnosisDependencies, diagnosis_agent
 
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def diagnosis_agent():
+    from aurelian.agents.diagnosis_agent import diagnosis_agent
 
-@pytest.fixture
+    return diagnosis_agent
+
+
+@pytest.fixture(scope="module")
 def deps():
+    from aurelian.agents.diagnosis_agent import DiagnosisDependencies
+
     return DiagnosisDependencies()
 
 
@@ -27,7 +33,8 @@ def deps():
         ("All eye phenotypes for Marfan syndrome (include HPO IDs)", "HP:0000518", None),
     ],
 )
-def test_ubergraph_agent(deps, query, ideal, model):
+@pytest.mark.vcr
+def test_ubergraph_agent(diagnosis_agent, deps, query, ideal, model):
     kwargs = {"model": model} if model else {}
     r = diagnosis_agent.run_sync(query, deps=deps, **kwargs)
     data = r.data
@@ -1,15 +1,20 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
+pytestmark = pytest.mark.live
 
-from aurelian.agents.gocam.gocam_config import GOCAMDependencies
-from aurelian.agents.gocam.gocam_agent import gocam_agent
 
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def gocam_agent():
+    from aurelian.agents.gocam.gocam_agent import gocam_agent
 
-@pytest.fixture
+    return gocam_agent
+
+
+@pytest.fixture(scope="module")
 def deps():
+    from aurelian.agents.gocam.gocam_config import GOCAMDependencies
+
     return GOCAMDependencies()
 
 
@@ -21,7 +26,8 @@ def deps():
         ("Find a model with ID gomodel:1234 and summarize it", None),
     ],
 )
-def test_gocam_agent(deps, query, ideal):
+@pytest.mark.vcr
+def test_gocam_agent(gocam_agent, deps, query, ideal):
     r = gocam_agent.run_sync(query, deps=deps)
     data = r.data
     assert data is not None
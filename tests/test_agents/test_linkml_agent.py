@@ -1,24 +1,31 @@
 import asyncio
 
 import pytest
-import os
 
-from pydantic_ai import RunContext
+pytestmark = pytest.mark.live
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
 
-from aurelian.agents.linkml.linkml_agent import linkml_agent
-from aurelian.agents.filesystem.filesystem_tools import write_to_file
-from aurelian.agents.linkml.linkml_config import LinkMLDependencies
-from aurelian.dependencies.workdir import WorkDir
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def linkml_agent():
+    from aurelian.agents.linkml.linkml_agent import linkml_agent
 
+    return linkml_agent
 
-@pytest.fixture
-def deps() -> LinkMLDependencies:
-    dep = LinkMLDependencies()
-    dep.workdir = WorkDir.create_temporary_workdir()
-    return dep
+
+@pytest.fixture(scope="module")
+def deps():
+    from aurelian.agents.linkml.linkml_config import LinkMLDependencies
+
+    return LinkMLDependencies()
+
+
+@pytest.fixture(autouse=True)
+def fresh_workdir(deps, tmp_path):
+    """Give each test its own workdir, as the module-scoped deps are shared."""
+    from aurelian.dependencies.workdir import WorkDir
+
+    deps.workdir = WorkDir(location=str(tmp_path))
 
 @pytest.mark.parametrize(
     "query,files,ideal",
@@ -32,8 +39,9 @@ def deps() -> LinkMLDependencies:
             ("Person", "age", "integer")),
     ]
 )
-def test_linkml_agent(record_property, deps, query, files, ideal):
-    record_property("agent", str(linkml_agent))
+@pytest.mark.vcr
+def test_linkml_agent(record_property, record_agent_property, linkml_agent, deps, query, files, ideal):
+    record_agent_property("agent", linkml_agent)
     record_property("query", query)
     if files:
         for (fn, content) in files:
@@ -46,7 +54,7 @@ def test_linkml_agent(record_property, deps, query, files, ideal):
             record_property("file", f"{fn}:\n```json\n{content}\n```")
     r = linkml_agent.run_sync(query, deps=deps)
     data = r.data
-    record_property("result", str(data))
+    record_agent_property("result", data)
     record_property("expected", str(ideal))
     assert data is not None
     if ideal is not None:
@@ -58,6 +66,11 @@ def test_linkml_agent(record_property, deps, query, files, ideal):
 
 
 def test_write_to_file(deps):
+    from pydantic_ai import RunContext
+
+    from aurelian.agents.filesystem.filesystem_tools import write_to_file
+    from aurelian.agents.linkml.linkml_config import LinkMLDependencies
+
     ctx = RunContext[LinkMLDependencies](deps=deps, model=None, usage=None, prompt=None)
     r = asyncio.run(write_to_file(ctx, "test.txt", "Hello, world!"))
     print(f"RESULT: {r}")
@@ -1,15 +1,20 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
+pytestmark = pytest.mark.live
 
-from aurelian.agents.literature.literature_config import LiteratureDependencies
-from aurelian.agents.literature.literature_agent import literature_agent
 
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def literature_agent():
+    from aurelian.agents.literature.literature_agent import literature_agent
 
-@pytest.fixture
+    return literature_agent
+
+
+@pytest.fixture(scope="module")
 def deps():
+    from aurelian.agents.literature.literature_config import LiteratureDependencies
+
     return LiteratureDependencies()
 
 
@@ -21,10 +26,9 @@ def deps():
         ("What does the literature say about circadian rhythm and sleep disorders?", "circadian"),
     ],
 )
-def test_literature_agent(deps, query, ideal):
+@pytest.mark.vcr
+def test_literature_agent(literature_agent, deps, query, ideal):
     r = literature_agent.run_sync(query, deps=deps)
-    for m in r.all_messages():
-        print(m)
     data = r.data
     assert data is not None
     if ideal is not None:
@@ -1,9 +1,10 @@
 """
 Tests for the Monarch agent.
 """
-import os
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import asyncio
 
 from pydantic_ai import ModelRetry
@@ -18,32 +19,21 @@ from aurelian.agents.monarch.monarch_config import MonarchDependencies, get_conf
 
 def test_get_gene_id():
     """Test gene ID normalization."""
-    ctx = MagicMock()
+    ctx = SimpleNamespace(deps=None)
     assert get_gene_id(ctx, "BRCA1") == "BRCA1"
     assert get_gene_id(ctx, "Gene:BRCA1") == "Gene:BRCA1"
 
 
 def test_get_disease_id():
     """Test disease ID normalization."""
-    ctx = MagicMock()
+    ctx = SimpleNamespace(deps=None)
     assert get_disease_id(ctx, "MONDO:0007254") == "MONDO:0007254"
     assert get_disease_id(ctx, "OMIM:143100") == "OMIM:143100"
 
 
 # ===== Integration tests with the actual Monarch agent =====
 
-# Skip integration tests in CI environments
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytestmark = pytest.mark.skip(reason="Skipping integration tests in GitHub Actions")
-else:
-    # Mark as integration tests that might be flaky due to external API calls
-    pytestmark = [
-        pytest.mark.integration,
-        pytest.mark.flaky(reruns=1, reruns_delay=2),
-    ]
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def deps():
     """Fixture to create a real Monarch dependencies object for integration tests."""
     return get_config()
@@ -62,10 +52,15 @@ def deps():
         ),
     ],
 )
-def test_monarch_agent_integration(record_property, deps, query, ideal):
+# Integration tests might be flaky due to external API calls (skipped in CI)
+@pytest.mark.live
+@pytest.mark.integration
+@pytest.mark.flaky(reruns=1, reruns_delay=2)
+@pytest.mark.vcr
+def test_monarch_agent_integration(record_property, record_agent_property, deps, query, ideal):
     """Integration test for the Monarch agent with real API calls."""
     # Record test metadata for reporting
-    record_property("agent", str(monarch_agent))
+    record_agent_property("agent", monarch_agent)
     record_property("query", query)
     
     # Call the agent
@@ -73,7 +68,7 @@ def test_monarch_agent_integration(record_property, deps, query, ideal):
     data = r.data
     
     # Record the result
-    record_property("result", str(data))
+    record_agent_property("result", data)
     
     # Verify results
     assert data is not None
@@ -1,15 +1,20 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
+pytestmark = pytest.mark.live
 
-from aurelian.agents.phenopackets.phenopackets_config import PhenopacketsDependencies
-from aurelian.agents.phenopackets.phenopackets_agent import phenopackets_agent
 
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def phenopackets_agent():
+    from aurelian.agents.phenopackets.phenopackets_agent import phenopackets_agent
 
-@pytest.fixture
+    return phenopackets_agent
+
+
+@pytest.fixture(scope="session")
 def deps():
+    from aurelian.agents.phenopackets.phenopackets_config import PhenopacketsDependencies
+
     return PhenopacketsDependencies()
 
 
@@ -21,10 +26,9 @@ def deps():
         ("What are the most common genes involved in skeletal dysplasias?", "skeletal"),
     ],
 )
-def test_phenopackets_agent(deps, query, ideal):
+@pytest.mark.vcr
+def test_phenopackets_agent(phenopackets_agent, deps, query, ideal):
     r = phenopackets_agent.run_sync(query, deps=deps)
-    for m in r.all_messages():
-        print(m)
     data = r.data
     assert data is not None
     if ideal is not None:
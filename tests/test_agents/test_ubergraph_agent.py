@@ -1,13 +1,20 @@
 import pytest
-import os
 
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
+pytestmark = pytest.mark.live
 
-from aurelian.agents.ubergraph.ubergraph_agent import Dependencies, ubergraph_agent
 
-@pytest.fixture
+# Agent modules are imported in fixtures so that skipped runs never pay for the import
+@pytest.fixture(scope="module")
+def ubergraph_agent():
+    from aurelian.agents.ubergraph.ubergraph_agent import ubergraph_agent
+
+    return ubergraph_agent
+
+
+@pytest.fixture(scope="session")
 def deps():
+    from aurelian.agents.ubergraph.ubergraph_agent import Dependencies
+
     return Dependencies()
 
 
@@ -18,7 +25,8 @@ def deps():
         ("Make a table with IDs of terms neuron, lymphocyte, and epithelial cell", ["CL:0000540"]),
     ],
 )
-def test_ubergraph_agent(deps, query, ideal):
+@pytest.mark.vcr
+def test_ubergraph_agent(ubergraph_agent, deps, query, ideal):
     r = ubergraph_agent.run_sync(query, deps=deps)
     data = r.data
     assert data is not None
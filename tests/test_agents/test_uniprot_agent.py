@@ -1,15 +1,24 @@
 """
 Tests for the UniProt agent.
 """
+import hashlib
+import inspect
 import os
+import shelve
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 from pydantic_ai import ModelRetry
 
+from aurelian.agents.uniprot import uniprot_agent as uniprot_agent_module
+from aurelian.agents.uniprot import uniprot_tools as uniprot_tools_module
 from aurelian.agents.uniprot.uniprot_agent import uniprot_agent
 from aurelian.agents.uniprot.uniprot_tools import (
     normalize_uniprot_id,
+    normalize_uniprot_ids,
     search,
     lookup_uniprot_entry,
     uniprot_mapping,
@@ -30,16 +39,21 @@ def test_normalize_uniprot_id():
     assert normalize_uniprot_id("P12345") == "P12345"
 
 
-@pytest.fixture
+def test_normalize_uniprot_ids():
+    """Test batch normalization agrees with normalizing each ID."""
+    ids = ["P12345.2", "UniProtKB:P12345", "P12345"] * 1000
+    assert normalize_uniprot_ids(ids) == [normalize_uniprot_id(x) for x in ids]
+    assert normalize_uniprot_ids([]) == []
+
+
+@pytest.fixture(scope="module")
 def mock_uniprot_client():
-    """Fixture to mock the UniProt client."""
-    with patch("bioservices.UniProt") as mock_uniprot:
-        mock_instance = MagicMock()
-        mock_uniprot.return_value = mock_instance
-        yield mock_instance
+    """Fixture to mock the UniProt client, shared by the unit tests in this module."""
+    # the config hands out this mock directly, so bioservices.UniProt itself never needs patching
+    return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config(mock_uniprot_client):
     """Fixture to create a mock config with the mocked client."""
     config = UniprotConfig()
@@ -47,14 +61,19 @@ def mock_config(mock_uniprot_client):
     return config
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_uniprot_client(mock_uniprot_client):
+    """Clear recorded calls and canned responses so tests sharing the mock client stay independent."""
+    mock_uniprot_client.reset_mock(return_value=True, side_effect=True)
+
+
 def test_search(mock_config, mock_uniprot_client):
     """Test the search function."""
     # Setup the mock to return a sample response
     mock_uniprot_client.search.return_value = "Entry\tGene\nP12345\tINS"
     
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function
     result = search(ctx, "insulin human")
@@ -76,8 +95,7 @@ def test_search_empty_results(mock_config, mock_uniprot_client):
     mock_uniprot_client.search.return_value = ""
     
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function and expect an exception
     with pytest.raises(ModelRetry) as excinfo:
@@ -93,8 +111,7 @@ def test_lookup_uniprot_entry(mock_config, mock_uniprot_client):
     mock_uniprot_client.retrieve.return_value = "ID   INS_HUMAN              Reviewed;"
     
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function
     result = lookup_uniprot_entry(ctx, "P01308")
@@ -112,8 +129,7 @@ def test_lookup_uniprot_entry_empty_result(mock_config, mock_uniprot_client):
     mock_uniprot_client.retrieve.return_value = ""
     
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function and expect an exception
     with pytest.raises(ModelRetry) as excinfo:
@@ -129,8 +145,7 @@ def test_uniprot_mapping(mock_config, mock_uniprot_client):
     mock_uniprot_client.mapping.return_value = {"P01308": ["1MSO", "1ZNJ"]}
     
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function
     result = uniprot_mapping(ctx, "PDB", ["P01308", "P01009"])
@@ -148,11 +163,21 @@ def test_uniprot_mapping(mock_config, mock_uniprot_client):
     assert "P01009" in args[2]
 
 
-def test_uniprot_mapping_empty_input(mock_config, mock_uniprot_client):
+def test_uniprot_mapping_deduplicates_accessions(mock_config, mock_uniprot_client):
+    """Test that repeated accessions are sent to UniProt once, in first-seen order."""
+    mock_uniprot_client.mapping.return_value = {"P01308": ["1MSO"]}
+    ctx = SimpleNamespace(deps=mock_config)
+
+    uniprot_mapping(ctx, "PDB", ["P01308", "UniProtKB:P01308", "P01009", "P01308"])
+
+    args, kwargs = mock_uniprot_client.mapping.call_args
+    assert args[2] == "P01308,P01009"
+
+
+def test_uniprot_mapping_empty_input(mock_config):
     """Test the uniprot_mapping function with empty input."""
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function and expect an exception
     with pytest.raises(ModelRetry) as excinfo:
@@ -168,8 +193,7 @@ def test_uniprot_mapping_empty_result(mock_config, mock_uniprot_client):
     mock_uniprot_client.mapping.return_value = {}
     
     # Create a mock context with our config
-    ctx = MagicMock()
-    ctx.deps = mock_config
+    ctx = SimpleNamespace(deps=mock_config)
     
     # Call the function and expect an exception
     with pytest.raises(ModelRetry) as excinfo:
@@ -181,25 +205,46 @@ def test_uniprot_mapping_empty_result(mock_config, mock_uniprot_client):
 
 # ===== Integration tests with the actual UniProt agent =====
 
-# Skip integration tests in CI environments
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytestmark = pytest.mark.skip(reason="Skipping integration tests in GitHub Actions")
-else:
-    # Mark as integration tests that might be flaky due to external API calls
-    pytestmark = [
-        pytest.mark.integration,
-        pytest.mark.flaky(reruns=1, reruns_delay=2),
-    ]
-
-
-@pytest.fixture
-def deps():
+@pytest.fixture(scope="session")
+def deps(tmp_path_factory):
     """Fixture to create a real UniProt dependencies object for integration tests."""
     config = get_config()
-    config.workdir = WorkDir.create_temporary_workdir()
+    config.workdir = WorkDir(location=str(tmp_path_factory.mktemp("uniprot")))
     return config
 
 
+AGENT_CACHE = Path(__file__).parent.parent / ".agent_cache"
+
+
+@pytest.fixture(scope="session")
+def run_agent_query():
+    """Run a query through the UniProt agent and return its output.
+
+    With ``AURELIAN_CACHE_AGENT=1``, outputs are kept on disk keyed by query and by the
+    source of the agent and tool modules (model, system prompt, tools), so local re-runs
+    skip the agent call until the agent changes.
+    """
+    if os.getenv("AURELIAN_CACHE_AGENT") != "1":
+        yield lambda query, deps: uniprot_agent.run_sync(query, deps=deps).data
+        return
+
+    agent_hash = hashlib.blake2b()
+    for module in (uniprot_agent_module, uniprot_tools_module):
+        agent_hash.update(inspect.getsource(module).encode())
+
+    with shelve.open(str(AGENT_CACHE)) as cache:
+
+        def _run(query, deps):
+            key_hash = agent_hash.copy()
+            key_hash.update(query.encode())
+            key = key_hash.hexdigest()
+            if key not in cache:
+                cache[key] = uniprot_agent.run_sync(query, deps=deps).data
+            return cache[key]
+
+        yield _run
+
+
 @pytest.mark.parametrize(
     "query,ideal",
     [
@@ -212,19 +257,24 @@ def deps():
             ["pdb", "entries", "1a7f"]
         ),
     ],
+    ids=["lookup_P01308", "map_P01308_PDB"],
 )
-def test_uniprot_agent_integration(record_property, deps, query, ideal):
+# Integration tests might be flaky due to external API calls (skipped in CI)
+@pytest.mark.live
+@pytest.mark.integration
+@pytest.mark.flaky(reruns=1, reruns_delay=2)
+@pytest.mark.vcr
+def test_uniprot_agent_integration(record_property, record_agent_property, run_agent_query, deps, query, ideal):
     """Integration test for the UniProt agent with real API calls."""
     # Record test metadata for reporting
-    record_property("agent", str(uniprot_agent))
+    record_agent_property("agent", uniprot_agent)
     record_property("query", query)
 
     # Call the agent
-    r = uniprot_agent.run_sync(query, deps=deps)
-    data = r.data
+    data = run_agent_query(query, deps)
     
     # Record the result
-    record_property("result", str(data))
+    record_agent_property("result", data)
     
     # Verify results
     assert data is not None
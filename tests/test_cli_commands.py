@@ -6,25 +6,36 @@ These tests mock out dependencies to avoid making actual API calls.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from click.testing import CliRunner
 
 from aurelian.cli import main
 
+AGENT_HELP_COMMANDS = (
+    "amigo", "biblio", "checklist", "chemistry",
+    "diagnosis", "gocam", "linkml", "literature", "mapper",
+    "monarch", "phenopackets", "rag", "robot", "ubergraph",
+)
+
 
 @pytest.fixture
-def mock_agent_runner():
+def mock_agent_runner(monkeypatch):
     """Mock the agent Runner to avoid actual API calls."""
-    with patch("aurelian.cli.run_agent") as mock_run:
-        mock_run.return_value = None
-        yield mock_run
+    mock_run = MagicMock(return_value=None)
+    monkeypatch.setattr("aurelian.cli.run_agent", mock_run)
+    return mock_run
+
+
+def invoke_command(name, *args):
+    """Parse args and run an aurelian subcommand in-process, without CliRunner's I/O isolation."""
+    command = main.commands[name]
+    with command.make_context(name, list(args)) as ctx:
+        return command.invoke(ctx)
 
 
 def test_agent_ui_mode(mock_agent_runner):
     """Test running an agent in UI mode."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["diagnosis", "--ui"])
-    assert result.exit_code == 0
+    invoke_command("diagnosis", "--ui")
     mock_agent_runner.assert_called_once()
     args, kwargs = mock_agent_runner.call_args
     assert kwargs["ui"] is True
@@ -33,9 +44,7 @@ def test_agent_ui_mode(mock_agent_runner):
 
 def test_agent_direct_query_mode(mock_agent_runner):
     """Test running an agent in direct query mode."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["diagnosis", "test query"])
-    assert result.exit_code == 0
+    invoke_command("diagnosis", "test query")
     mock_agent_runner.assert_called_once()
     args, kwargs = mock_agent_runner.call_args
     assert kwargs["ui"] is False
@@ -45,9 +54,7 @@ def test_agent_direct_query_mode(mock_agent_runner):
 
 def test_chemistry_command(mock_agent_runner):
     """Test the chemistry command specifically since we just fixed it."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["chemistry", "what is aspirin"])
-    assert result.exit_code == 0
+    invoke_command("chemistry", "what is aspirin")
     mock_agent_runner.assert_called_once()
     args, kwargs = mock_agent_runner.call_args
     # Check correct parameters are passed 
@@ -65,17 +72,9 @@ def test_datasheets_help():
     assert "Run with a URL for direct mode" in result.output
 
 
-def test_all_agent_commands_help():
-    """Test that all agent commands display help correctly."""
-    runner = CliRunner()
-    commands = [
-        "amigo", "biblio", "checklist", "chemistry", 
-        "diagnosis", "gocam", "linkml", "literature", "mapper", 
-        "monarch", "phenopackets", "rag", "robot", "ubergraph"
-    ]
-    
-    for command in commands:
-        result = runner.invoke(main, [command, "--help"])
-        assert result.exit_code == 0, f"Help for {command} failed with {result.output}"
-        assert "Run with a query for direct mode" in result.output or "Run with a URL for direct mode" in result.output, \
-            f"Missing mode info in {command} help"
\ No newline at end of file
+@pytest.mark.parametrize("command", AGENT_HELP_COMMANDS)
+def test_agent_command_help(command_help, command):
+    """Test that each agent command displays help correctly."""
+    help_text = command_help(command)
+    assert "Run with a query for direct mode" in help_text or "Run with a URL for direct mode" in help_text, \
+        f"Missing mode info in {command} help"
@@ -13,31 +13,53 @@ from pathlib import Path
 # Set testing mode for agents that need special handling in tests
 os.environ["TESTING"] = "1"
 
+# Run on the same xdist worker as the CLI import tests, so agent modules are only imported once
+pytestmark = pytest.mark.xdist_group("cli_imports")
+
+
+# Utility directories that aren't actual agents
+NON_AGENT_DIRS = {"filesystem", "oak", "web"}
+
 
 def get_agent_dirs():
     """Get all agent directories."""
     src_dir = Path(__file__).parent.parent / "src" / "aurelian" / "agents"
-    agent_dirs = []
-    
-    for item in src_dir.iterdir():
-        if item.is_dir() and not item.name.startswith("__"):
-            # Skip utility directories that aren't actual agents
-            if item.name not in ["filesystem", "oak", "web"]:
-                agent_dirs.append(item.name)
-    
-    return agent_dirs
+    with os.scandir(src_dir) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and not entry.name.startswith("__")
+            and entry.name not in NON_AGENT_DIRS
+        )
+
+
+AGENT_DIRS = tuple(get_agent_dirs())
+
+
+@pytest.fixture(scope="session")
+def agent_config():
+    """Get an agent's config, calling its get_config() at most once per session."""
+    configs = {}
+
+    def _get_config(agent_name):
+        if agent_name not in configs:
+            config_module = importlib.import_module(f"aurelian.agents.{agent_name}.{agent_name}_config")
+            configs[agent_name] = config_module.get_config()
+        return configs[agent_name]
+
+    return _get_config
 
 
 def test_agent_dirs_exist():
     """Verify we're finding agent directories correctly."""
-    agent_dirs = get_agent_dirs()
     # Ensure we find at least the known agents
     essential_agents = ["diagnosis", "amigo", "chemistry", "linkml"]
     for agent in essential_agents:
-        assert agent in agent_dirs, f"Could not find essential agent: {agent}"
+        assert agent in AGENT_DIRS, f"Could not find essential agent: {agent}"
 
 
-@pytest.mark.parametrize("agent_name", get_agent_dirs())
+@pytest.mark.parametrize("agent_name", AGENT_DIRS)
 def test_agent_has_config_module(agent_name):
     """Test that each agent has a config module."""
     try:
@@ -47,15 +69,15 @@ def test_agent_has_config_module(agent_name):
         pytest.fail(f"Agent {agent_name} is missing a config module: {e}")
 
 
-@pytest.mark.parametrize("agent_name", get_agent_dirs())
-def test_agent_has_get_config_function(agent_name):
+@pytest.mark.parametrize("agent_name", AGENT_DIRS)
+def test_agent_has_get_config_function(agent_config, agent_name):
     """Test that each agent's config module has a get_config function."""
     try:
         config_module = importlib.import_module(f"aurelian.agents.{agent_name}.{agent_name}_config")
         assert hasattr(config_module, "get_config"), f"Agent {agent_name} config module missing get_config function"
         
         # Test that get_config is callable and returns something
-        config = config_module.get_config()
+        config = agent_config(agent_name)
         assert config is not None, f"get_config for {agent_name} returned None"
     except ImportError as e:
         pytest.fail(f"Failed to import config module for {agent_name}: {e}")
@@ -63,12 +85,11 @@ def test_agent_has_get_config_function(agent_name):
         pytest.fail(f"Error calling get_config for {agent_name}: {e}")
 
 
-@pytest.mark.parametrize("agent_name", get_agent_dirs())
-def test_agent_config_has_workdir(agent_name):
+@pytest.mark.parametrize("agent_name", AGENT_DIRS)
+def test_agent_config_has_workdir(agent_config, agent_name):
     """Test that each agent's config has a workdir attribute."""
     try:
-        config_module = importlib.import_module(f"aurelian.agents.{agent_name}.{agent_name}_config")
-        config = config_module.get_config()
+        config = agent_config(agent_name)
         
         # Test that config has workdir attribute
         assert hasattr(config, "workdir"), f"Agent {agent_name} config missing workdir attribute"
@@ -9,6 +9,9 @@ from click.testing import CliRunner
 
 from aurelian.cli import main
 
+# Run on the same xdist worker as the CLI config tests, so agent modules are only imported once
+pytestmark = pytest.mark.xdist_group("cli_imports")
+
 
 def test_cli_main_help():
     """Test that the main CLI help command works."""
@@ -28,13 +31,14 @@ def get_agent_commands():
     return agent_commands
 
 
-@pytest.mark.parametrize("command", get_agent_commands())
-def test_agent_command_imports(command):
+AGENT_COMMANDS = tuple(get_agent_commands())
+
+
+@pytest.mark.parametrize("command", AGENT_COMMANDS)
+def test_agent_command_imports(command_help, command):
     """Test that importing each agent's modules works without errors."""
-    runner = CliRunner()
-    result = runner.invoke(main, [command, "--help"])
-    assert result.exit_code == 0, f"Failed to import modules for command '{command}': {result.output}"
-    assert f"Usage: " in result.output
+    help_text = command_help(command)
+    assert "Usage: " in help_text, f"Failed to render help for command '{command}'"
 
 
 def test_agent_direct_query_mode():
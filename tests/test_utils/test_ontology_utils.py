@@ -1,17 +1,29 @@
 import pytest
-import os
-
-if os.getenv("GITHUB_ACTIONS") == "true":
-    pytest.skip("Skipping in GitHub Actions", allow_module_level=True)
 
 from aurelian.utils.ontology_utils import search_ontology
 from oaklib import get_adapter
 
+pytestmark = pytest.mark.live
+
+
+@pytest.fixture(scope="session")
+def ontology_adapter():
+    """Return a getter that builds each adapter handle once per session."""
+    cache = {}
+
+    def _get(handle):
+        if handle not in cache:
+            cache[handle] = get_adapter(handle)
+        return cache[handle]
+
+    return _get
+
+
 @pytest.mark.parametrize("handle,term,limit,expected", [
     ("sqlite:obo:bfo", "3D spatial", 10, [("BFO:0000028", "three-dimensional spatial region")]),
-])
-def test_search_ontology(record_property, handle, term, limit, expected):
-    adapter = get_adapter(handle)
+], ids=["bfo_3d_spatial"])
+def test_search_ontology(record_property, ontology_adapter, handle, term, limit, expected):
+    adapter = ontology_adapter(handle)
     record_property("query", term)
     results = search_ontology(adapter, term, limit=limit)
     record_property("results", results)
@@ -1,24 +1,63 @@
+import os
+import re
+import shlex
+import shutil
+import subprocess
+from pathlib import Path
+
 import pytest
 from aurelian.dependencies.workdir import WorkDir
 from aurelian.utils.robot_ontology_utils import run_robot_template_command
 
-from tests import OUTPUT_DIR, INPUT_DIR
+from tests import INPUT_DIR
+
+
+@pytest.fixture(scope="session")
+def robot_test_template(tmp_path_factory) -> Path:
+    """Pristine copy of the robot test inputs, made once per session."""
+    template = tmp_path_factory.mktemp("robot_template") / "robot_test"
+    shutil.copytree(INPUT_DIR / "robot_test", template)
+    return template
+
+
+@pytest.fixture
+def test_workdir(robot_test_template, tmp_path) -> WorkDir:
+    # inputs are only read by robot, so hardlinking them from the template is safe
+    location = tmp_path / "robot_test"
+    shutil.copytree(robot_test_template, location, copy_function=os.link)
+    return WorkDir(location=str(location))
+
+
+STUB_OWL = """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:owl="http://www.w3.org/2002/07/owl#">
+    <owl:Ontology/>
+</rdf:RDF>
+"""
 
 
 @pytest.fixture
-def test_workdir() -> WorkDir:
-    workdir = WorkDir(location=str(OUTPUT_DIR / "robot_test"))
-    for f in workdir.list_file_names():
-        workdir.delete_file(f)
-    input_workdir = WorkDir(location=str(INPUT_DIR / "robot_test"))
-    for f in input_workdir.list_file_names():
-        workdir.write_file(f, input_workdir.read_file(f))
-    return workdir
+def fake_robot(monkeypatch):
+    """Replace the robot subprocess with one that writes a stub ontology to ``--output``.
 
+    Returns the list of commands that would have been run.
+    """
+    commands = []
 
+    def fake_run(cmd, *args, **kwargs):
+        commands.append(cmd)
+        location = re.match(r"cd (\S+) &&", cmd).group(1)
+        tokens = shlex.split(cmd)
+        output = tokens[tokens.index("--output") + 1]
+        Path(location, output).write_text(STUB_OWL)
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
 
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return commands
 
-def test_robot_ontology_utils(test_workdir):
+
+@pytest.mark.unit
+def test_robot_ontology_utils(test_workdir, fake_robot):
     run_robot_template_command(
         test_workdir,
         "snacks.csv",
@@ -26,9 +65,12 @@ def test_robot_ontology_utils(test_workdir):
         "test_output.owl",
         ["imports.csv"],
     )
+    assert test_workdir.check_file_exists("test_output.owl")
+    assert any("robot merge --input imports.owl" in cmd for cmd in fake_robot)
 
 
-def test_robot_ontology_utils_deps(test_workdir):
+@pytest.mark.unit
+def test_robot_ontology_utils_deps(test_workdir, fake_robot):
     run_robot_template_command(
         test_workdir,
         "snacks.csv",
@@ -36,8 +78,22 @@ def test_robot_ontology_utils_deps(test_workdir):
         "test_output.owl",
         ["imports.owl"],
     )
+    assert test_workdir.check_file_exists("imports.owl")
+    assert test_workdir.check_file_exists("test_output.owl")
 
 
+@pytest.mark.integration
+def test_robot_ontology_utils_robot(test_workdir):
+    run_robot_template_command(
+        test_workdir,
+        "snacks.csv",
+        {"SNK": "http://example.org/snack#"},
+        "test_output.owl",
+        ["imports.csv"],
+    )
+
+
+@pytest.mark.integration
 def test_robot_ontology_utils_noimport_fails(test_workdir):
     with pytest.raises(Exception):
         run_robot_template_command(
@@ -47,6 +103,8 @@ def test_robot_ontology_utils_noimport_fails(test_workdir):
             "test_output.owl",
         )
 
+
+@pytest.mark.integration
 def test_robot_ontology_utils_noprefix_fails(test_workdir):
     with pytest.raises(Exception):
         run_robot_template_command(